@@ -0,0 +1,39 @@
+// The library generator is a plain Node script without TypeScript definitions.
+// eslint-disable-next-line @typescript-eslint/no-var-requires
+const { attachPreprocessed, entrySources } = require('../tools/build-skill-universe-library');
+
+describe('skill library preprocessed index merge', () => {
+  const hdrSource = 'assets/skill-universe/material-ingredients/gases/HDR_hazy_nebulae.hdr';
+  const tifSource = 'assets/skill-universe/material-ingredients/gases/heic0109a.tif';
+  const records = {
+    [hdrSource]: { source: hdrSource, sourceSha256: 'a'.repeat(64) },
+    [tifSource]: { source: tifSource, sourceSha256: 'b'.repeat(64) }
+  };
+
+  it('resolves absolute and relativePath-based map sources', () => {
+    expect(entrySources({ maps: { environment: hdrSource } })).toEqual([hdrSource]);
+    expect(entrySources({
+      relativePath: 'material-ingredients/gases',
+      maps: { albedo: 'heic0109a.tif' }
+    })).toEqual([tifSource]);
+    expect(entrySources({ maps: { albedo: 'orphan.tif' } })).toEqual([]);
+  });
+
+  it('attaches matching records and leaves other entries untouched', () => {
+    const categories: Record<string, any[]> = {
+      gases: [
+        { id: 'nebula_hdr-hazy-nebulae', maps: { environment: hdrSource } },
+        { id: 'heic0109a', relativePath: 'material-ingredients/gases', maps: { albedo: 'heic0109a.tif' } },
+        { id: 'unprocessed', maps: { environment: 'assets/skill-universe/material-ingredients/gases/other.hdr' } }
+      ],
+      metals: [{ id: 'steel', relativePath: 'material-ingredients/metals/Steel', maps: { albedo: 'Steel.jpg' } }]
+    };
+
+    attachPreprocessed(categories, records);
+
+    expect(categories.gases[0].preprocessed).toBe(records[hdrSource]);
+    expect(categories.gases[1].preprocessed).toBe(records[tifSource]);
+    expect(categories.gases[2]).not.toHaveProperty('preprocessed');
+    expect(categories.metals[0]).not.toHaveProperty('preprocessed');
+  });
+});
@@ -0,0 +1,150 @@
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+tifffile = pytest.importorskip("tifffile")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+import preprocess_nebulae as pn  # noqa: E402
+
+
+def encode_rgbe(rgb):
+    peak = rgb.max(axis=2)
+    lit = peak > 1e-30
+    exponent = np.where(lit, np.ceil(np.log2(np.where(lit, peak, 1.0))), 0).astype(np.int32)
+    mantissa = np.where(lit[..., None], rgb / np.ldexp(1.0, exponent - 8)[..., None], 0.0)
+    rgbe = np.empty(rgb.shape[:2] + (4,), dtype=np.uint8)
+    rgbe[..., :3] = np.clip(mantissa, 0, 255).astype(np.uint8)
+    rgbe[..., 3] = np.where(lit, exponent + 128, 0)
+    return rgbe
+
+
+def decode_rgbe(rgbe):
+    exponent = rgbe[..., 3].astype(np.int32)
+    scale = np.where(exponent > 0, np.ldexp(1.0, exponent - 136), 0.0)
+    return rgbe[..., :3] * scale[..., None]
+
+
+def rle_channel(values):
+    out = bytearray()
+    i = 0
+    while i < len(values):
+        run = 1
+        while i + run < len(values) and run < 127 and values[i + run] == values[i]:
+            run += 1
+        if run >= 3:
+            out += bytes((128 + run, values[i]))
+            i += run
+            continue
+        start = i
+        while i < len(values) and i - start < 128:
+            if i + 2 < len(values) and values[i] == values[i + 1] == values[i + 2]:
+                break
+            i += 1
+        out += bytes((i - start,)) + bytes(values[start:i])
+    return out
+
+
+def write_hdr(path, rgbe, rle):
+    height, width = rgbe.shape[:2]
+    data = bytearray(b"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n-Y %d +X %d\n" % (height, width))
+    for row in rgbe:
+        if rle:
+            data += bytes((2, 2, width >> 8, width & 0xFF))
+            for channel in range(4):
+                data += rle_channel(row[:, channel].tobytes())
+        else:
+            data += row.tobytes()
+    path.write_bytes(bytes(data))
+
+
+def read_full(path):
+    with pn.open_source(path) as reader:
+        image = np.zeros((reader.height, reader.width, 3))
+        for y0, x0, block in reader.bands():
+            # Planar-separate TIFFs deliver one channel per block, so accumulate.
+            image[y0:y0 + block.shape[0], x0:x0 + block.shape[1]] += block
+    return image
+
+
+def srgb_to_linear(encoded):
+    return np.where(encoded <= 0.04045, encoded / 12.92, ((encoded + 0.055) / 1.055) ** 2.4)
+
+
+@pytest.fixture
+def rgbe():
+    rng = np.random.default_rng(7)
+    image = rng.random((37, 90, 3)) * 6.0
+    image[:, 20:60] = 1.5
+    pixels = encode_rgbe(image)
+    # R=G=B=1 is a legal flat pixel, not an old-style RLE marker.
+    pixels[3, 5] = (1, 1, 1, 130)
+    return pixels
+
+
+@pytest.mark.parametrize("rle", [True, False])
+def test_hdr_round_trip(tmp_path, rgbe, rle):
+    path = tmp_path / "sky.hdr"
+    write_hdr(path, rgbe, rle)
+    np.testing.assert_array_equal(read_full(path), decode_rgbe(rgbe))
+
+
+def test_truncated_hdr_raises_value_error(tmp_path, rgbe):
+    path = tmp_path / "sky.hdr"
+    write_hdr(path, rgbe, rle=True)
+    path.write_bytes(path.read_bytes()[:-200])
+    with pytest.raises(ValueError, match="Truncated"):
+        read_full(path)
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"tile": (16, 32), "compression": "zlib"},
+    {"tile": (16, 16), "compression": "zlib", "planarconfig": "separate"},
+])
+def test_tiff_matches_imread(tmp_path, options):
+    rng = np.random.default_rng(3)
+    pixels = (rng.random((45, 70, 3)) * 65535).astype(np.uint16)
+    path = tmp_path / "plate.tif"
+    if options.get("planarconfig") == "separate":
+        tifffile.imwrite(path, np.moveaxis(pixels, 2, 0), photometric="rgb", **options)
+    else:
+        tifffile.imwrite(path, pixels, photometric="rgb", **options)
+
+    with pn.open_source(path) as reader:
+        assert reader._page.is_memmappable == (not options)
+    expected = tifffile.imread(path)
+    if options.get("planarconfig") == "separate":
+        expected = np.moveaxis(expected, 0, 2)
+    np.testing.assert_allclose(read_full(path), srgb_to_linear(expected / 65535.0), atol=1e-5)
+
+
+def test_box_accumulator_matches_block_mean():
+    rng = np.random.default_rng(11)
+    image = rng.random((12, 18, 3))
+    accumulator = pn.BoxAccumulator(18, 12, 6, 4)
+    for y0 in range(0, 12, 5):
+        for x0 in range(0, 18, 7):
+            accumulator.add(y0, x0, image[y0:y0 + 5, x0:x0 + 7])
+    expected = image.reshape(4, 3, 6, 3, 3).mean(axis=(1, 3))
+    np.testing.assert_allclose(accumulator.mean(), expected)
+
+
+def test_constant_environment_sh_and_prefilter():
+    coefficients = pn.project_sh9(np.full((128, 256, 3), 2.0))
+    np.testing.assert_allclose(coefficients[0], 2.0 * 0.282095 * 4.0 * math.pi, rtol=1e-5)
+    np.testing.assert_allclose(coefficients[1:], 0.0, atol=1e-3)
+    environment = np.full((32, 64, 3), 2.0)
+    for roughness in (0.25, 1.0):
+        np.testing.assert_allclose(pn.prefilter_ggx(environment, roughness), 2.0, rtol=1e-9)
+
+
+def test_rgbm_round_trip():
+    linear = np.array([[[0.0, 0.0, 0.0], [0.02, 0.5, 1.0], [3.0, 7.5, 15.9]]])
+    encoded = pn.encode_rgbm(linear).astype(np.float64) / 255.0
+    decoded = encoded[..., :3] * encoded[..., 3:] * pn.RGBM_RANGE
+    np.testing.assert_allclose(decoded, linear, atol=0.04, rtol=0.02)
@@ -16,6 +16,7 @@ const BASE_PATH = 'assets/skill-universe';
 const GASES_ROOT = path.join(INGREDIENT_ROOT, 'gases');
 const NOISE_ROOT = path.join(INGREDIENT_ROOT, 'noise');
 const ABSOLUTE_PREFIX = path.join('assets', 'skill-universe', 'material-ingredients');
+const PREPROCESSED_INDEX = path.join(PROJECT_ROOT, 'assets/skill-universe/prefiltered/index.json');
 
 const IMAGE_EXTENSIONS = new Set(['.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp', '.exr', '.hdr']);
 
@@ -432,6 +433,44 @@ function gatherCategory(categoryName) {
     return libraryEntries;
 }
 
+function loadPreprocessedIndex() {
+    if (!fs.existsSync(PREPROCESSED_INDEX)) {
+        return {};
+    }
+    try {
+        return JSON.parse(fs.readFileSync(PREPROCESSED_INDEX, 'utf8')).entries || {};
+    } catch (error) {
+        console.warn('Ignoring unreadable preprocessed index:', error.message);
+        return {};
+    }
+}
+
+function entrySources(entry) {
+    const sources = [];
+    for (const value of Object.values(entry.maps || {})) {
+        if (typeof value !== 'string') {
+            continue;
+        }
+        if (value.startsWith(`${BASE_PATH}/`)) {
+            sources.push(value);
+        } else if (entry.relativePath) {
+            sources.push(`${BASE_PATH}/${toPosixPath(entry.relativePath)}/${value}`);
+        }
+    }
+    return sources;
+}
+
+function attachPreprocessed(categories, records = loadPreprocessedIndex()) {
+    for (const items of Object.values(categories)) {
+        for (const entry of items) {
+            const source = entrySources(entry).find((candidate) => records[candidate]);
+            if (source) {
+                entry.preprocessed = records[source];
+            }
+        }
+    }
+}
+
 function buildLibrary() {
     const categories = ['metals', 'minerals', 'organics', 'gases', 'other'];
     const results = {};
@@ -450,6 +489,8 @@ function buildLibrary() {
         results.noise = upsertEntries(results.noise, noiseEntries).sort((a, b) => a.name.localeCompare(b.name));
     }
 
+    attachPreprocessed(results);
+
     return {
         generatedAt: new Date().toISOString(),
         basePath: BASE_PATH,
@@ -476,4 +517,8 @@ function main() {
     console.log('   Contents:', summary);
 }
 
-main();
+if (require.main === module) {
+    main();
+}
+
+module.exports = { attachPreprocessed, entrySources };
@@ -0,0 +1,606 @@
+"""Bake lightweight lighting data for the Skill Universe nebula plates.
+
+Every `.hdr` / `.tif` inside `assets/skill-universe/material-ingredients/gases`
+is streamed once (Radiance scanlines through `mmap`, TIFF strips/tiles through
+tifffile) into a bounded area-averaging accumulator, so memory stays flat no
+matter how large the source is. From that accumulator we derive:
+
+* L2 spherical-harmonic coefficients in the `THREE.LightProbe` convention,
+* a small GGX-prefiltered roughness mip chain stored as RGBM PNGs,
+* downsampled sRGB preview tiers.
+
+Results land in `assets/skill-universe/prefiltered/<slug>/`, are listed in
+`prefiltered/index.json`, and are attached to the matching entries of
+`ingredient-library.json` under `preprocessed`.
+
+Requires numpy, tifffile and imagecodecs (`pip install numpy tifffile imagecodecs`);
+without imagecodecs tifffile cannot decode LZW/JPEG-compressed TIFFs.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import tifffile
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BASE_PATH = "assets/skill-universe"
+SKILL_UNIVERSE_ROOT = PROJECT_ROOT / BASE_PATH
+GASES_ROOT = SKILL_UNIVERSE_ROOT / "material-ingredients" / "gases"
+OUTPUT_ROOT = SKILL_UNIVERSE_ROOT / "prefiltered"
+LIBRARY_FILE = SKILL_UNIVERSE_ROOT / "ingredient-library.json"
+
+SOURCE_EXTENSIONS = {".hdr", ".tif", ".tiff"}
+LFS_POINTER_PREFIX = b"version https://git-lfs"
+
+PREVIEW_MAX_EDGE = 2048
+PREVIEW_TIERS = 4
+ENVIRONMENT_WIDTH = 256
+ROUGHNESS_LEVELS = (0.0, 0.25, 0.5, 0.75, 1.0)
+MIN_PREFILTER_WIDTH = 32
+PREFILTER_CHUNK_TEXELS = 512
+RGBM_RANGE = 16.0
+BAND_PIXELS = 1 << 20
+HASH_CHUNK_BYTES = 1 << 20
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
+
+def slugify(value):
+    slug = re.sub(r"[^a-z0-9]+", "-", value.lower())
+    return re.sub(r"-{2,}", "-", slug).strip("-")
+
+
+def to_project_path(path: Path) -> str:
+    return path.resolve().relative_to(PROJECT_ROOT).as_posix()
+
+
+def output_slug(source_path: Path) -> str:
+    source_path = source_path.resolve()
+    try:
+        relative = source_path.relative_to(GASES_ROOT).as_posix()
+    except ValueError:
+        relative = to_project_path(source_path)
+    digest = hashlib.sha1(relative.encode("utf-8")).hexdigest()[:8]
+    return slugify(relative) or f"source-{digest}"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_lfs_pointer(path: Path) -> bool:
+    with path.open("rb") as handle:
+        return handle.read(len(LFS_POINTER_PREFIX)) == LFS_POINTER_PREFIX
+
+
+class BoxAccumulator:
+    """Area-averages an arbitrarily large image into a fixed-size grid.
+
+    Blocks can arrive in any order and any shape (scanline bands, strips or
+    tiles); each source pixel must be added exactly once.
+    """
+
+    def __init__(self, src_width, src_height, dst_width, dst_height):
+        if dst_width > src_width or dst_height > src_height:
+            raise ValueError("BoxAccumulator can only downsample")
+        self._row_bins = np.arange(src_height, dtype=np.int64) * dst_height // src_height
+        self._col_bins = np.arange(src_width, dtype=np.int64) * dst_width // src_width
+        self._counts = np.outer(
+            np.bincount(self._row_bins, minlength=dst_height),
+            np.bincount(self._col_bins, minlength=dst_width),
+        )
+        self.sums = np.zeros((dst_height, dst_width, 3), dtype=np.float64)
+
+    @staticmethod
+    def _run_starts(bins):
+        return np.flatnonzero(np.concatenate(([True], bins[1:] != bins[:-1])))
+
+    def add(self, y0, x0, block):
+        height, width = block.shape[:2]
+        rows = self._row_bins[y0:y0 + height]
+        cols = self._col_bins[x0:x0 + width]
+        row_starts = self._run_starts(rows)
+        col_starts = self._run_starts(cols)
+        reduced = np.add.reduceat(block.astype(np.float64), row_starts, axis=0)
+        reduced = np.add.reduceat(reduced, col_starts, axis=1)
+        self.sums[np.ix_(rows[row_starts], cols[col_starts])] += reduced
+
+    def mean(self):
+        return self.sums / self._counts[..., None]
+
+
+class HdrReader:
+    """Streams a Radiance RGBE file scanline by scanline through `mmap`."""
+
+    is_hdr = True
+
+    def __init__(self, path: Path):
+        self._handle = path.open("rb")
+        self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offset, self.width, self.height = self._parse_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._map.close()
+        self._handle.close()
+
+    def _readline(self, pos):
+        end = self._map.find(b"\n", pos)
+        if end < 0:
+            raise ValueError("Truncated Radiance header")
+        return self._map[pos:end].decode("ascii", "replace").strip(), end + 1
+
+    def _parse_header(self):
+        magic, pos = self._readline(0)
+        if not magic.startswith("#?"):
+            raise ValueError("Not a Radiance HDR file")
+        while True:
+            line, pos = self._readline(pos)
+            if not line:
+                break
+            if line.startswith("FORMAT=") and line != "FORMAT=32-bit_rle_rgbe":
+                raise ValueError(f"Unsupported Radiance format: {line[7:]}")
+        resolution, pos = self._readline(pos)
+        match = re.fullmatch(r"-Y\s+(\d+)\s+\+X\s+(\d+)", resolution)
+        if not match:
+            raise ValueError(f"Unsupported Radiance orientation: {resolution}")
+        return pos, int(match.group(2)), int(match.group(1))
+
+    def _decode_scanline(self, pos, out):
+        data = self._map
+        size = len(data)
+        width = self.width
+        if pos + 4 > size:
+            raise ValueError("Truncated Radiance scanline")
+        if not (8 <= width < 0x8000 and data[pos] == 2 and data[pos + 1] == 2 and data[pos + 2] < 128):
+            end = pos + width * 4
+            if end > size:
+                raise ValueError("Truncated Radiance scanline")
+            out[:] = np.frombuffer(data[pos:end], dtype=np.uint8).reshape(width, 4).T
+            return end
+
+        if (data[pos + 2] << 8 | data[pos + 3]) != width:
+            raise ValueError("Radiance scanline width mismatch")
+        pos += 4
+        channel = bytearray(width)
+        for index in range(4):
+            x = 0
+            while x < width:
+                if pos >= size:
+                    raise ValueError("Truncated Radiance scanline")
+                count = data[pos]
+                pos += 1
+                if count > 128:
+                    count -= 128
+                    if x + count > width:
+                        raise ValueError("Corrupt Radiance run length")
+                    if pos >= size:
+                        raise ValueError("Truncated Radiance scanline")
+                    channel[x:x + count] = bytes((data[pos],)) * count
+                    pos += 1
+                else:
+                    if count == 0 or x + count > width:
+                        raise ValueError("Corrupt Radiance run length")
+                    if pos + count > size:
+                        raise ValueError("Truncated Radiance scanline")
+                    channel[x:x + count] = data[pos:pos + count]
+                    pos += count
+                x += count
+            out[index] = np.frombuffer(channel, dtype=np.uint8)
+        return pos
+
+    def bands(self):
+        band_rows = max(1, BAND_PIXELS // self.width)
+        pos = self._offset
+        for y0 in range(0, self.height, band_rows):
+            rows = min(band_rows, self.height - y0)
+            rgbe = np.empty((rows, 4, self.width), dtype=np.uint8)
+            for row in range(rows):
+                pos = self._decode_scanline(pos, rgbe[row])
+            exponent = rgbe[:, 3].astype(np.int32)
+            scale = np.where(exponent > 0, np.ldexp(np.float32(1.0), exponent - 136), 0.0).astype(np.float32)
+            yield y0, 0, rgbe[:, :3].transpose(0, 2, 1) * scale[..., None]
+
+
+class TiffReader:
+    """Streams the first TIFF page via memory mapping or per-segment decoding."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._tiff = tifffile.TiffFile(path)
+        self._page = self._tiff.pages[0]
+        page = self._page
+        if page.photometric not in (tifffile.PHOTOMETRIC.RGB, tifffile.PHOTOMETRIC.MINISBLACK):
+            raise ValueError(f"Unsupported TIFF photometric: {page.photometric.name}")
+        self.width = page.imagewidth
+        self.height = page.imagelength
+        self.is_hdr = np.dtype(page.dtype).kind == "f"
+        self._separate = page.planarconfig == tifffile.PLANARCONFIG.SEPARATE and page.samplesperpixel > 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._tiff.close()
+
+    def _to_linear(self, data):
+        if data.ndim == 2:
+            data = data[..., None]
+        if data.shape[2] < 3:
+            data = np.repeat(data[..., :1], 3, axis=2)
+        data = data[..., :3]
+        if self.is_hdr:
+            return data.astype(np.float32)
+        encoded = data.astype(np.float32) / np.iinfo(data.dtype).max
+        return np.where(encoded <= 0.04045, encoded / 12.92, ((encoded + 0.055) / 1.055) ** 2.4)
+
+    def bands(self):
+        if self._page.is_memmappable and not self._separate:
+            image = tifffile.memmap(self._path, page=0, mode="r")
+            try:
+                band_rows = max(1, BAND_PIXELS // self.width)
+                for y0 in range(0, self.height, band_rows):
+                    yield y0, 0, self._to_linear(np.asarray(image[y0:y0 + band_rows]))
+            finally:
+                del image
+            return
+
+        for segment, index, _shape in self._page.segments(maxworkers=1):
+            if segment is None:
+                continue
+            plane, _depth, y0, x0, _sample = index
+            data = segment[0, :self.height - y0, :self.width - x0]
+            if self._separate:
+                grayscale = self._page.samplesperpixel < 3
+                if plane >= (1 if grayscale else 3):
+                    continue
+                # Channels arrive one plane at a time; sums stay additive.
+                linear = self._to_linear(data[..., 0])
+                if not grayscale:
+                    linear[..., [c for c in range(3) if c != plane]] = 0.0
+                yield y0, x0, linear
+            else:
+                yield y0, x0, self._to_linear(data)
+
+
+def open_source(path: Path):
+    if path.suffix.lower() == ".hdr":
+        return HdrReader(path)
+    return TiffReader(path)
+
+
+def fit_long_edge(width, height, max_edge):
+    scale = min(1.0, max_edge / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def resample(image, width, height):
+    src_height, src_width = image.shape[:2]
+    if width > src_width:
+        image = image[:, ((np.arange(width) + 0.5) * src_width / width).astype(np.int64)]
+    if height > src_height:
+        image = image[((np.arange(height) + 0.5) * src_height / height).astype(np.int64)]
+    accumulator = BoxAccumulator(image.shape[1], image.shape[0], width, height)
+    accumulator.add(0, 0, image)
+    return accumulator.mean()
+
+
+def equirect_texels(width, height):
+    """Unit directions and solid angles matching three.js `equirectUv`."""
+    lat = (0.5 - (np.arange(height) + 0.5) / height) * math.pi
+    phi = ((np.arange(width) + 0.5) / width - 0.5) * 2.0 * math.pi
+    lat, phi = np.meshgrid(lat, phi, indexing="ij")
+    directions = np.stack(
+        (np.cos(lat) * np.cos(phi), np.sin(lat), np.cos(lat) * np.sin(phi)),
+        axis=-1,
+    )
+    solid_angle = np.cos(lat) * (2.0 * math.pi / width) * (math.pi / height)
+    return directions.reshape(-1, 3), solid_angle.reshape(-1)
+
+
+def project_sh9(environment):
+    height, width = environment.shape[:2]
+    directions, weights = equirect_texels(width, height)
+    x, y, z = directions.T
+    basis = np.stack((
+        np.full_like(x, 0.282095),
+        0.488603 * y,
+        0.488603 * z,
+        0.488603 * x,
+        1.092548 * x * y,
+        1.092548 * y * z,
+        0.315392 * (3.0 * z * z - 1.0),
+        1.092548 * x * z,
+        0.546274 * (x * x - y * y),
+    ))
+    coefficients = (basis * weights) @ environment.reshape(-1, 3)
+    return coefficients * (4.0 * math.pi / weights.sum())
+
+
+def prefilter_ggx(environment, roughness):
+    """Split-sum prefilter (N = V) of an equirect map for one roughness."""
+    height, width = environment.shape[:2]
+    directions, solid_angle = equirect_texels(width, height)
+    radiance = environment.reshape(-1, 3)
+    alpha2 = roughness ** 4
+    result = np.empty_like(radiance)
+    for start in range(0, len(directions), PREFILTER_CHUNK_TEXELS):
+        cos_theta = directions[start:start + PREFILTER_CHUNK_TEXELS] @ directions.T
+        n_dot_l = np.clip(cos_theta, 0.0, 1.0)
+        n_dot_h2 = (1.0 + cos_theta) * 0.5
+        distribution = alpha2 / (math.pi * (n_dot_h2 * (alpha2 - 1.0) + 1.0) ** 2)
+        weights = distribution * n_dot_l * solid_angle
+        result[start:start + PREFILTER_CHUNK_TEXELS] = (weights @ radiance) / weights.sum(axis=1, keepdims=True)
+    return result.reshape(height, width, 3)
+
+
+def encode_rgbm(linear):
+    linear = np.clip(linear, 0.0, RGBM_RANGE)
+    multiplier = np.clip(linear.max(axis=2, keepdims=True) / RGBM_RANGE, 1e-6, 1.0)
+    multiplier = np.ceil(multiplier * 255.0) / 255.0
+    rgb = np.clip(linear / (multiplier * RGBM_RANGE), 0.0, 1.0)
+    return np.round(np.concatenate((rgb, multiplier), axis=2) * 255.0).astype(np.uint8)
+
+
+def encode_preview(linear, tonemap):
+    if tonemap:
+        linear = linear / (1.0 + linear)
+    linear = np.clip(linear, 0.0, 1.0)
+    srgb = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1.0 / 2.4) - 0.055)
+    return np.round(srgb * 255.0).astype(np.uint8)
+
+
+def write_png(path: Path, pixels):
+    height, width, channels = pixels.shape
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 1:] = pixels.reshape(height, -1)
+
+    def chunk(tag, data):
+        return (
+            struct.pack(">I", len(data))
+            + tag
+            + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    color_type = 6 if channels == 4 else 2
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def process_source(source_path: Path, output_dir: Path):
+    with open_source(source_path) as reader:
+        preview_width, preview_height = fit_long_edge(reader.width, reader.height, PREVIEW_MAX_EDGE)
+        accumulator = BoxAccumulator(reader.width, reader.height, preview_width, preview_height)
+        for y0, x0, block in reader.bands():
+            accumulator.add(y0, x0, block)
+        width, height, is_hdr = reader.width, reader.height, reader.is_hdr
+    base = accumulator.mean()
+    del accumulator
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    previews = []
+    tier = base
+    for _ in range(PREVIEW_TIERS):
+        tier_height, tier_width = tier.shape[:2]
+        tier_path = output_dir / f"preview-{tier_width}.png"
+        write_png(tier_path, encode_preview(tier, tonemap=is_hdr))
+        previews.append({"width": tier_width, "height": tier_height, "path": to_project_path(tier_path)})
+        if min(tier_width, tier_height) < 2:
+            break
+        tier = resample(tier, tier_width // 2, tier_height // 2)
+
+    environment = resample(base, ENVIRONMENT_WIDTH, ENVIRONMENT_WIDTH // 2)
+    levels = []
+    for level, roughness in enumerate(ROUGHNESS_LEVELS):
+        level_width = max(2, ENVIRONMENT_WIDTH >> level)
+        level_height = max(1, level_width // 2)
+        if roughness == 0.0:
+            filtered = resample(environment, level_width, level_height)
+        else:
+            # Filter at a floor resolution so wide lobes still see enough texels.
+            filter_width = max(MIN_PREFILTER_WIDTH, level_width)
+            filtered = prefilter_ggx(resample(environment, filter_width, filter_width // 2), roughness)
+            filtered = resample(filtered, level_width, level_height)
+        level_path = output_dir / f"env-r{round(roughness * 100):03d}.png"
+        write_png(level_path, encode_rgbm(filtered))
+        levels.append({
+            "roughness": roughness,
+            "width": level_width,
+            "height": level_height,
+            "path": to_project_path(level_path),
+        })
+
+    return {
+        "source": to_project_path(source_path),
+        "sourceBytes": source_path.stat().st_size,
+        "sourceSha256": file_sha256(source_path),
+        "width": width,
+        "height": height,
+        "dynamicRange": "hdr" if is_hdr else "ldr",
+        "irradiance": {
+            "type": "sh3",
+            "convention": "three.LightProbe",
+            "coefficients": [[round(float(v), 6) for v in row] for row in project_sh9(environment)],
+        },
+        "environment": {
+            "projection": "equirectangular",
+            "encoding": "rgbm",
+            "range": RGBM_RANGE,
+            "levels": levels,
+        },
+        "previews": previews,
+    }
+
+
+def is_current(record, source_path: Path):
+    if not record:
+        return False
+    # Content digest rather than mtime, which changes on every clone / LFS pull.
+    if record.get("sourceBytes") != source_path.stat().st_size:
+        return False
+    if record.get("sourceSha256") != file_sha256(source_path):
+        return False
+    environment = record.get("environment")
+    levels = environment.get("levels") if isinstance(environment, dict) else None
+    previews = record.get("previews")
+    if not isinstance(levels, list) or not isinstance(previews, list) or not levels or not previews:
+        return False
+    outputs = levels + previews
+    if not all(isinstance(item, dict) and isinstance(item.get("path"), str) for item in outputs):
+        return False
+    return all((PROJECT_ROOT / item["path"]).exists() for item in outputs)
+
+
+def entry_sources(entry):
+    relative = entry.get("relativePath")
+    for value in (entry.get("maps") or {}).values():
+        if not isinstance(value, str):
+            continue
+        if value.startswith(f"{BASE_PATH}/"):
+            yield value
+        elif relative:
+            yield f"{BASE_PATH}/{relative}/{value}"
+
+
+def update_library(records):
+    if not LIBRARY_FILE.exists():
+        return 0
+    original = LIBRARY_FILE.read_text(encoding="utf-8")
+    library = json.loads(original)
+    updated = 0
+    for entries in (library.get("categories") or {}).values():
+        for entry in entries:
+            record = next((records[source] for source in entry_sources(entry) if source in records), None)
+            if record:
+                entry["preprocessed"] = record
+                updated += 1
+            else:
+                entry.pop("preprocessed", None)
+    serialized = json.dumps(library, indent=2, ensure_ascii=False)
+    if serialized != original:
+        LIBRARY_FILE.write_text(serialized, encoding="utf-8")
+    return updated
+
+
+def collect_sources(paths):
+    roots = [Path(p).resolve() for p in paths] or [GASES_ROOT]
+    for root in roots:
+        if not root.is_relative_to(PROJECT_ROOT):
+            raise ValueError(f"{root} is outside the project; copy it into {to_project_path(GASES_ROOT)} first")
+    sources = []
+    for root in roots:
+        candidates = sorted(root.rglob("*")) if root.is_dir() else [root]
+        for candidate in candidates:
+            if candidate.is_file() and candidate.suffix.lower() in SOURCE_EXTENSIONS:
+                sources.append(candidate)
+    return sources
+
+
+def load_index(index_file: Path):
+    if not index_file.exists():
+        return {}
+    try:
+        entries = json.loads(index_file.read_text(encoding="utf-8")).get("entries", {})
+    except (OSError, ValueError, AttributeError) as error:
+        print(f"! Ignoring unreadable preprocessed index: {error}", file=sys.stderr)
+        return {}
+    if not isinstance(entries, dict):
+        print("! Ignoring malformed preprocessed index: `entries` is not an object", file=sys.stderr)
+        return {}
+    return {source: record for source, record in entries.items() if isinstance(record, dict)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="Files or folders to process (defaults to the gases folder).")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Parallel worker processes, a few hundred MB each (default {DEFAULT_JOBS}).")
+    parser.add_argument("--force", action="store_true", help="Reprocess sources even if outputs are current.")
+    args = parser.parse_args(argv)
+
+    index_file = OUTPUT_ROOT / "index.json"
+    previous = load_index(index_file)
+    # Forget sources that were deleted since the last run.
+    records = {source: record for source, record in previous.items() if (PROJECT_ROOT / source).is_file()}
+
+    try:
+        sources = collect_sources(args.paths)
+    except ValueError as error:
+        parser.error(str(error))
+    slugs = {}
+    for source in sorted({*(PROJECT_ROOT / path for path in records), *sources}):
+        slug = output_slug(source)
+        if slug in slugs:
+            print(f"✗ {to_project_path(slugs[slug])} and {to_project_path(source)} both map to "
+                  f"prefiltered/{slug}/; rename one of them", file=sys.stderr)
+            return 1
+        slugs[slug] = source
+
+    pending = []
+    for source in sources:
+        if is_lfs_pointer(source):
+            print(f"- Skipping {source.name}: Git LFS pointer (run `git lfs pull` first)")
+        elif not args.force and is_current(records.get(to_project_path(source)), source):
+            print(f"= {source.name} is up to date")
+        else:
+            pending.append(source)
+
+    failures = 0
+    try:
+        with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = {
+                executor.submit(process_source, source, OUTPUT_ROOT / output_slug(source)): source
+                for source in pending
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    record = future.result()
+                except Exception as error:  # A bad source must not discard finished records.
+                    failures += 1
+                    print(f"✗ {source.name}: {type(error).__name__}: {error}", file=sys.stderr)
+                    continue
+                records[record["source"]] = record
+                print(f"✓ {source.name} → {Path(record['previews'][0]['path']).parent.as_posix()}")
+    finally:
+        records = dict(sorted(records.items()))
+        if records != previous:
+            OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
+            index = {
+                "generatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "basePath": BASE_PATH,
+                "entries": records,
+            }
+            index_file.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+        updated = update_library(records)
+
+    print(f"   Processed {len(pending) - failures}/{len(pending)}, manifest entries updated: {updated}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())